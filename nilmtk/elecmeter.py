@@ -5,8 +5,8 @@ from copy import deepcopy
 import numpy as np
 import pandas as pd
 from six import iteritems
-from .preprocessing import Clip
-from .stats import TotalEnergy, GoodSections, DropoutRate
+from .stats import (TotalEnergy, ClippedTotalEnergy, GoodSections,
+                    DropoutRate)
 from .hashable import Hashable
 from .measurement import (select_best_ac_type, PHYSICAL_QUANTITIES,
                           check_ac_type, check_physical_quantity)
@@ -156,14 +156,20 @@ class ElecMeter(Hashable, Electric):
         -------
         dict describing the MeterDevice for this meter (sample period etc).
         """
+        return deepcopy(self._device)
+
+    @property
+    def _device(self):
+        """Same as `device` but returns the shared MeterDevice dict without
+        copying it.  Only for read-only use inside ElecMeter."""
         device_model = self.metadata.get('device_model')
         if device_model:
-            return deepcopy(ElecMeter.meter_devices[device_model])
+            return ElecMeter.meter_devices[device_model]
         else:
             return {}
 
     def sample_period(self):
-        device = self.device
+        device = self._device
         if device:
             return device['sample_period']
 
@@ -260,7 +266,7 @@ class ElecMeter(Hashable, Electric):
             raise ValueError("`physical_quantity` must by one of '{}', not '{}'"
                              .format(PHYSICAL_QUANTITIES, physical_quantity))
 
-        measurements = self.device['measurements']
+        measurements = self._device['measurements']
         return [m['type'] for m in measurements
                 if m['physical_quantity'] == physical_quantity
                 and 'type' in m]
@@ -271,7 +277,7 @@ class ElecMeter(Hashable, Electric):
         -------
         list of strings e.g. ['power', 'energy']
         """
-        measurements = self.device['measurements']
+        measurements = self._device['measurements']
         return list(set([m['physical_quantity'] for m in measurements]))
 
     def available_columns(self):
@@ -280,29 +286,30 @@ class ElecMeter(Hashable, Electric):
         -------
         list of 2-tuples of strings e.g. [('power', 'active')]
         """
-        measurements = self.device['measurements']
+        measurements = self._device['measurements']
         return list(set([(m['physical_quantity'], m.get('type', ''))
                          for m in measurements]))
 
     def __repr__(self):
-        string = super(ElecMeter, self).__repr__()
-        # Now add list of appliances...
-        string = string[:-1]  # remove last bracket
+        parts = []
+        if self.identifier is not None:
+            parts.append("instance={!r}, building={!r}, dataset={!r}"
+                         .format(*self.identifier))
 
         # Site meter
-        if self.metadata.get('site_meter'):
-            string += ', site_meter'
+        metadata = self.metadata
+        if metadata.get('site_meter'):
+            parts.append('site_meter')
 
         # Appliances
-        string += ', appliances={}'.format(self.appliances)
+        parts.append('appliances={}'.format(self.appliances))
 
         # METER ROOM
-        room = self.metadata.get('room')
+        room = metadata.get('room')
         if room:
-            string += ', room={}'.format(room)
+            parts.append('room={}'.format(room))
 
-        string += ')'
-        return string
+        return "{:s}({:s})".format(self.__class__.__name__, ", ".join(parts))
 
     def matches(self, key):
         """
@@ -331,8 +338,8 @@ class ElecMeter(Hashable, Electric):
                 if self.metadata[k] != v:
                     match = False
 
-            elif k in self.device:
-                metadata_value = self.device[k]
+            elif k in self._device:
+                metadata_value = self._device[k]
                 if (isinstance(metadata_value, list) and
                         not isinstance(v, list)):
                     if v not in metadata_value:
@@ -424,7 +431,7 @@ class ElecMeter(Hashable, Electric):
             if 'limit' not in resample_kwargs:
                 sample_period = kwargs.get('sample_period', self.sample_period())
                 max_number_of_rows_to_ffill = int(
-                    np.ceil(self.device['max_sample_period'] / sample_period))
+                    np.ceil(self._device['max_sample_period'] / sample_period))
                 resample_kwargs.update({'limit': max_number_of_rows_to_ffill})
 
         if verbose:
@@ -581,7 +588,7 @@ class ElecMeter(Hashable, Electric):
         if `full_results` is True then return TotalEnergyResults object
         else returns a pd.Series with a row for each AC type.
         """
-        nodes = [Clip, TotalEnergy]
+        nodes = [ClippedTotalEnergy]
         return self._get_stat_from_cache_or_compute(
             nodes, TotalEnergy.results_class(), loader_kwargs)
 
@@ -620,7 +627,7 @@ class ElecMeter(Hashable, Electric):
         """
         loader_kwargs.setdefault('n_look_ahead_rows', 10)
         nodes = [GoodSections]
-        results_obj = GoodSections.results_class(self.device['max_sample_period'])
+        results_obj = GoodSections.results_class(self._device['max_sample_period'])
         return self._get_stat_from_cache_or_compute(
             nodes, results_obj, loader_kwargs)
 
@@ -1,3 +1,3 @@
-from .totalenergy import TotalEnergy
+from .totalenergy import TotalEnergy, ClippedTotalEnergy
 from .goodsections import GoodSections
 from .dropoutrate import DropoutRate
@@ -1,12 +1,14 @@
 #!/usr/bin/python
 from __future__ import print_function, division
 import unittest
-from ..totalenergy import TotalEnergy, _energy_for_power_series
+from ..totalenergy import (TotalEnergy, ClippedTotalEnergy, get_total_energy,
+                           _energy_for_power_series)
 from ...preprocessing import Clip
 from ... import TimeFrame, ElecMeter, HDFDataStore
 from ...elecmeter import ElecMeterID
 from ...consts import JOULES_PER_KWH
 from ...tests.testingtools import data_dir
+from ...node import Node
 from os.path import join
 import numpy as np
 import pandas as pd
@@ -22,6 +24,19 @@ def check_energy_numbers(testcase, energy):
     testcase.assertAlmostEqual(energy['apparent'], true_active_kwh*1.1)
 
 
+class _StaticMetadata(object):
+    """Minimal upstream for a source Node which just serves `metadata`."""
+
+    def __init__(self, metadata):
+        self.metadata = metadata
+
+    def dry_run_metadata(self):
+        return self.metadata
+
+    def get_metadata(self):
+        return self.metadata
+
+
 class TestEnergy(unittest.TestCase):
 
     @classmethod
@@ -55,6 +70,59 @@ class TestEnergy(unittest.TestCase):
         energy_results = deepcopy(energy.results)
         check_energy_numbers(self, energy_results.combined())
 
+    def test_clipped_pipeline(self):
+        meter = ElecMeter(store=self.datastore, 
+                          metadata=self.meter_meta, 
+                          meter_id=METER_ID)
+        source_node = meter.get_source_node()
+        energy = ClippedTotalEnergy(source_node)
+        energy.run()
+        energy_results = deepcopy(energy.results)
+        check_energy_numbers(self, energy_results.combined())
+
+    def test_clipped_energy_matches_clip_then_energy(self):
+        columns = [('power', 'active'), ('energy', 'reactive'),
+                   ('cumulative energy', 'apparent')]
+        measurements = [
+            {'physical_quantity': pq, 'type': ac_type,
+             'lower_limit': 0, 'upper_limit': 1000}
+            for pq, ac_type in columns]
+        data = np.array([[-50,   -5,  -10],
+                         [100,  200,  200],
+                         [5000, 3000, 4000],
+                         [200,  100,  600],
+                         [0,   -20,  1500]], dtype=float)
+        secs = np.arange(start=0, stop=len(data)*10, step=10)
+        index = [pd.Timestamp('2010-01-01') + timedelta(seconds=int(sec))
+                 for sec in secs]
+        df = pd.DataFrame(data, index=index,
+                          columns=pd.MultiIndex.from_tuples(columns))
+        df.timeframe = TimeFrame(index[0], index[-1])
+        metadata = {'device': {'max_sample_period': 15,
+                               'measurements': measurements}}
+
+        fused = get_total_energy(df.copy(), 15, measurements)
+
+        unclipped = get_total_energy(df.copy(), 15)
+        for ac_type in ['active', 'reactive', 'apparent']:
+            self.assertNotAlmostEqual(fused[ac_type], unclipped[ac_type])
+
+        source_node = Node(_StaticMetadata(metadata), generator=iter([df]))
+        energy = TotalEnergy(Clip(source_node))
+        energy.run()
+        expected = energy.results.combined()
+        for ac_type in ['active', 'reactive', 'apparent']:
+            self.assertAlmostEqual(fused[ac_type], expected[ac_type])
+
+    def test_energy_per_clipped_power_series(self):
+        data = np.array([0, 100, 5000, 0])
+        secs = np.arange(start=0, stop=len(data)*10, step=10)
+        true_kwh = ((data[:-1].clip(0, 1000) * np.diff(secs)) / JOULES_PER_KWH).sum()
+        index = [pd.Timestamp('2010-01-01') + timedelta(seconds=int(sec)) for sec in secs]
+        df = pd.Series(data=data, index=index)
+        kwh = _energy_for_power_series(df, max_sample_period=15, lower=0, upper=1000)
+        self.assertAlmostEqual(true_kwh, kwh)
+
 if __name__ == '__main__':
     unittest.main()
 
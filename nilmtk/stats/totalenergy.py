@@ -3,6 +3,7 @@ import numpy as np
 import gc
 from .totalenergyresults import TotalEnergyResults
 from ..node import Node
+from ..preprocessing.clip import _find_limits
 from ..utils import timedelta64_to_secs
 from ..consts import JOULES_PER_KWH
 from ..measurement import AC_TYPES
@@ -37,13 +38,41 @@ class TotalEnergy(Node):
                 ['power', 'energy', 'cumulative energy']]
 
 
-def get_total_energy(df, max_sample_period):
+class ClippedTotalEnergy(TotalEnergy):
+    """Equivalent to a `Clip` node followed by a `TotalEnergy` node
+    but does both in a single pass over each chunk.
+
+    Only the columns used to calculate energy are clipped and the clipped
+    values are not written back into the chunk, so chunks are yielded
+    downstream unmodified.  Use `Clip` and `TotalEnergy` if downstream
+    nodes need clipped data.
+    """
+
+    requirements = {'device': {'max_sample_period': 'ANY VALUE',
+                               'measurements': 'ANY VALUE'}}
+
+    def process(self):
+        self.check_requirements()
+        metadata = self.upstream.get_metadata()
+        max_sample_period = metadata['device']['max_sample_period']
+        measurements = metadata['device']['measurements']
+        for chunk in self.upstream.process():
+            energy = get_total_energy(chunk, max_sample_period, measurements)
+            self.results.append(chunk.timeframe, energy)
+            yield chunk
+
+
+def get_total_energy(df, max_sample_period, measurements=None):
     """Calculate total energy for energy / power data in a dataframe.
 
     Parameters
     ----------
     df : pd.DataFrame
     max_sample_period : float or int
+    measurements : list of dicts, optional
+        The 'measurements' of the meter device.  If supplied then each
+        column is clipped to the 'lower_limit' and 'upper_limit' of its
+        measurement before calculating energy.
 
     Returns
     -------
@@ -68,22 +97,32 @@ def get_total_energy(df, max_sample_period):
     for col in selected_columns:
         (physical_quantity, ac_type) = col
         series = df[col]
+        lower, upper = (None, None)
+        if measurements is not None:
+            lower, upper = _find_limits(col, measurements)
         if physical_quantity == 'power':
-            energy[ac_type] = _energy_for_power_series(series, max_sample_period)
-        elif physical_quantity == 'cumulative energy':
-            energy[ac_type] = series.iloc[-1] - series.iloc[0]
-        elif physical_quantity == 'energy':
-            energy[ac_type] = series.sum()
+            energy[ac_type] = _energy_for_power_series(
+                series, max_sample_period, lower, upper)
+        else:
+            if lower is not None and upper is not None:
+                series = series.clip(lower, upper)
+            if physical_quantity == 'cumulative energy':
+                energy[ac_type] = series.iloc[-1] - series.iloc[0]
+            elif physical_quantity == 'energy':
+                energy[ac_type] = series.sum()
 
     return energy
 
 
-def _energy_for_power_series(series, max_sample_period):
+def _energy_for_power_series(series, max_sample_period,
+                             lower=None, upper=None):
     """
     Parameters
     ----------
     series : pd.Series
     max_sample_period : float or int
+    lower, upper : numbers, optional
+        If both are set then power values are clipped to [lower, upper].
 
     Returns
     -------
@@ -96,6 +135,9 @@ def _energy_for_power_series(series, max_sample_period):
     del timedelta
     gc.collect()
     timedelta_secs = timedelta_secs.clip(max=max_sample_period)
-    joules = (timedelta_secs * series.values[:-1]).sum()
+    values = series.values[:-1]
+    if lower is not None and upper is not None:
+        values = np.clip(values, lower, upper)
+    joules = (timedelta_secs * values).sum()
     kwh = joules / JOULES_PER_KWH
     return kwh
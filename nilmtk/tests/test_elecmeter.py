@@ -7,6 +7,7 @@ from datetime import timedelta
 from .testingtools import data_dir, WarningTestMixin
 from ..datastore import HDFDataStore
 from ..elecmeter import ElecMeter, ElecMeterID
+from .. import global_meter_group
 from ..stats.tests.test_totalenergy import check_energy_numbers
 
 METER_ID = ElecMeterID(instance=1, building=1, dataset='REDD')
@@ -60,6 +61,40 @@ class TestElecMeter(WarningTestMixin, unittest.TestCase):
         meter3 = ElecMeter(metadata={'submeter_of': 2}, meter_id=METER_ID3)
         self.assertEquals(meter3.upstream_meter(), meter2)
 
+    def test_global_meter_group_registration(self):
+        meter_id = ElecMeterID(instance=1, building=1, dataset='REGISTRATION')
+        meter1 = ElecMeter(metadata={'site_meter': True}, meter_id=meter_id)
+        meter1_again = ElecMeter(meter_id=meter_id)
+        self.assertIs(global_meter_group[meter_id], meter1)
+        self.assertFalse(any(meter is meter1_again
+                             for meter in global_meter_group.meters))
+        meter2 = ElecMeter(metadata={'submeter_of': 1},
+                           meter_id=meter_id._replace(instance=2))
+        self.assertIs(meter2.upstream_meter(), meter1)
+
+    def test_device_reads_meter_devices_live(self):
+        # `_device` must not return a stale copy of `meter_devices`
+        model = 'test elecmeter model'
+        ElecMeter.meter_devices[model] = {
+            'measurements': [{'physical_quantity': 'power', 'type': 'active'}]}
+        self.addCleanup(ElecMeter.meter_devices.pop, model, None)
+        meter = ElecMeter(metadata={'device_model': model})
+        self.assertEqual(meter.available_ac_types('power'), ['active'])
+        ElecMeter.meter_devices[model] = {
+            'measurements': [{'physical_quantity': 'power', 'type': 'apparent'},
+                             {'physical_quantity': 'voltage'}]}
+        self.assertEqual(meter.available_ac_types('power'), ['apparent'])
+        self.assertEqual(set(meter.available_columns()),
+                         set([('power', 'apparent'), ('voltage', '')]))
+
+    def test_repr(self):
+        meter = ElecMeter(metadata={'site_meter': True}, meter_id=METER_ID)
+        self.assertEqual(repr(meter),
+                         "ElecMeter(instance=1, building=1, dataset='REDD',"
+                         " site_meter, appliances=[])")
+        meter = ElecMeter()
+        self.assertEqual(repr(meter), "ElecMeter(appliances=[])")
+
     def test_proportion_of_energy(self):
         meter = ElecMeter(store=self.datastore, metadata=self.meter_meta, 
                           meter_id=METER_ID)